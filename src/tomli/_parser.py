@@ -4,8 +4,8 @@
 
 from __future__ import annotations
 
+import re
 import sys
-from types import MappingProxyType
 
 from ._re import (
     RE_DATETIME,
@@ -34,17 +34,52 @@ if TYPE_CHECKING:
 # lower number than where mypyc binaries crash.
 MAX_INLINE_NESTING: Final = sys.getrecursionlimit()
 
-ASCII_CTRL: Final = frozenset(chr(i) for i in range(32)) | frozenset(chr(127))
+# Regex character class contents of the ASCII control characters that
+# are illegal in strings and comments. Tab is always allowed, and line
+# feed is allowed in multiline strings. Quotation marks and backslashes
+# are handled as separate cases in the parser functions.
+ILLEGAL_CHARS: Final = r"\x00-\x08\x0a-\x1f\x7f"
+ILLEGAL_MULTILINE_CHARS: Final = r"\x00-\x08\x0b-\x1f\x7f"
 
-# Neither of these sets include quotation mark or backslash. They are
-# currently handled as separate cases in the parser functions.
-ILLEGAL_BASIC_STR_CHARS: Final = ASCII_CTRL - frozenset("\t")
-ILLEGAL_MULTILINE_BASIC_STR_CHARS: Final = ASCII_CTRL - frozenset("\t\n")
+RE_ILLEGAL_LITERAL_STR_CHAR: Final = re.compile(f"[{ILLEGAL_CHARS}]")
+RE_ILLEGAL_MULTILINE_LITERAL_STR_CHAR: Final = re.compile(
+    f"[{ILLEGAL_MULTILINE_CHARS}]"
+)
 
-ILLEGAL_LITERAL_STR_CHARS: Final = ILLEGAL_BASIC_STR_CHARS
-ILLEGAL_MULTILINE_LITERAL_STR_CHARS: Final = ILLEGAL_MULTILINE_BASIC_STR_CHARS
+# Match a run of basic string characters that need no special handling,
+# i.e. everything except quotation mark, backslash and illegal characters.
+# Single character escapes (e.g. "\\n") are also included. They are
+# replaced in bulk using `RE_SIMPLE_ESCAPE` once the run is sliced out.
+RE_BASIC_STR_PLAIN_CHARS: Final = re.compile(
+    rf'[^"\\{ILLEGAL_CHARS}]*(?:\\[btnfr"\\][^"\\{ILLEGAL_CHARS}]*)*'
+)
+RE_MULTILINE_BASIC_STR_PLAIN_CHARS: Final = re.compile(
+    rf'[^"\\{ILLEGAL_MULTILINE_CHARS}]*'
+    rf'(?:\\[btnfr"\\][^"\\{ILLEGAL_MULTILINE_CHARS}]*)*'
+)
+RE_SIMPLE_ESCAPE: Final = re.compile(r'\\[btnfr"\\]')
 
-ILLEGAL_COMMENT_CHARS: Final = ILLEGAL_BASIC_STR_CHARS
+# Match one or more bare key parts separated by dots, e.g. "a.b . c",
+# and the whitespace following them
+RE_DOTTED_BARE_KEY: Final = re.compile(
+    r"([A-Za-z0-9_-]+(?:[ \t]*\.[ \t]*[A-Za-z0-9_-]+)*)[ \t]*"
+)
+RE_KEY_SEPARATOR: Final = re.compile(r"[ \t]*\.[ \t]*")
+
+# Match whitespace and an optional comment at the end of a statement
+RE_STATEMENT_TAIL: Final = re.compile(rf"[ \t]*(#[^{ILLEGAL_CHARS}]*)?")
+# Match whitespace, newlines and comments between array values
+RE_ARRAY_WS_AND_COMMENTS: Final = re.compile(rf"(?:[ \t\n]|(#[^{ILLEGAL_CHARS}]*))*")
+# Match a comma and the decimal integer following it in an array. The
+# lookahead rejects floats, dates etc. which need the full parser. The
+# second alternative also allows newline terminated comments around the
+# comma. It is kept separate so that uncommented arrays don't pay for it.
+ARRAY_WS_RE_STR: Final = rf"[ \t\n]*(?:#[^{ILLEGAL_CHARS}]*\n[ \t\n]*)*"
+RE_ARRAY_NEXT_INT: Final = re.compile(
+    r"[ \t\n]*,[ \t\n]*([+-]?(?:0|[1-9](?:_?[0-9])*))(?=[ \t\n,\]])"
+    rf"|{ARRAY_WS_RE_STR},{ARRAY_WS_RE_STR}"
+    r"([+-]?(?:0|[1-9](?:_?[0-9])*))(?=[ \t\n,\]#])"
+)
 
 TOML_WS: Final = frozenset(" \t")
 TOML_WS_AND_NEWLINE: Final = TOML_WS | frozenset("\n")
@@ -54,17 +89,15 @@ BARE_KEY_CHARS: Final = frozenset(
 KEY_INITIAL_CHARS: Final = BARE_KEY_CHARS | frozenset("\"'")
 HEXDIGIT_CHARS: Final = frozenset("abcdef" "ABCDEF" "0123456789")
 
-BASIC_STR_ESCAPE_REPLACEMENTS: Final = MappingProxyType(
-    {
-        "\\b": "\u0008",  # backspace
-        "\\t": "\u0009",  # tab
-        "\\n": "\u000A",  # linefeed
-        "\\f": "\u000C",  # form feed
-        "\\r": "\u000D",  # carriage return
-        '\\"': "\u0022",  # quote
-        "\\\\": "\u005C",  # backslash
-    }
-)
+BASIC_STR_ESCAPE_REPLACEMENTS: Final = {
+    "\\b": "\u0008",  # backspace
+    "\\t": "\u0009",  # tab
+    "\\n": "\u000A",  # linefeed
+    "\\f": "\u000C",  # form feed
+    "\\r": "\u000D",  # carriage return
+    '\\"': "\u0022",  # quote
+    "\\\\": "\u005C",  # backslash
+}
 
 
 class DEPRECATED_DEFAULT:
@@ -114,10 +147,8 @@ class TOMLDecodeError(ValueError):
             return
 
         lineno = doc.count("\n", 0, pos) + 1
-        if lineno == 1:
-            colno = pos + 1
-        else:
-            colno = pos - doc.rindex("\n", 0, pos)
+        # rfind() returns -1 on the first line, giving a column of pos + 1
+        colno = pos - doc.rfind("\n", 0, pos)
 
         if pos >= len(doc):
             coord_repr = "end of document"
@@ -149,9 +180,11 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
     """Parse TOML from a string."""
 
     # The spec allows converting "\r\n" to "\n", even in string
-    # literals. Let's do so to simplify parsing.
+    # literals. Let's do so to simplify parsing. Searching for a single
+    # "\r" first is much faster than a `str.replace` that finds nothing
+    # to replace, which is the case for most documents.
     try:
-        src = __s.replace("\r\n", "\n")
+        src = __s.replace("\r\n", "\n") if __s.find("\r") != -1 else __s
     except (AttributeError, TypeError):
         raise TypeError(
             f"Expected str object, not '{type(__s).__qualname__}'"
@@ -159,13 +192,14 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
     pos = 0
     out = Output()
     header: Key = ()
+    header_nest = out.data.dict
     parse_float = make_safe_parse_float(parse_float)
 
     # Parse one statement at a time
     # (typically means one line in TOML source)
     while True:
         # 1. Skip line leading whitespace
-        pos = skip_chars(src, pos, TOML_WS)
+        pos = skip_ws(src, pos)
 
         # 2. Parse rules. Expect one of the following:
         #    - end of file
@@ -183,8 +217,7 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
             pos += 1
             continue
         if char in KEY_INITIAL_CHARS:
-            pos = key_value_rule(src, pos, out, header, parse_float)
-            pos = skip_chars(src, pos, TOML_WS)
+            pos = key_value_rule(src, pos, out, header, header_nest, parse_float)
         elif char == "[":
             try:
                 second_char: str | None = src[pos + 1]
@@ -192,15 +225,15 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
                 second_char = None
             out.flags.finalize_pending()
             if second_char == "[":
-                pos, header = create_list_rule(src, pos, out)
+                pos, header, header_nest = create_list_rule(src, pos, out)
             else:
-                pos, header = create_dict_rule(src, pos, out)
-            pos = skip_chars(src, pos, TOML_WS)
+                pos, header, header_nest = create_dict_rule(src, pos, out)
         elif char != "#":
             raise TOMLDecodeError("Invalid statement", src, pos)
 
-        # 3. Skip comment
-        pos = skip_comment(src, pos)
+        # 3. Skip trailing whitespace and comment
+        tail_match = RE_STATEMENT_TAIL.match(src, pos)
+        pos = tail_match.end()  # type: ignore[union-attr]
 
         # 4. Expect end of line or end of file
         try:
@@ -208,6 +241,9 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
         except IndexError:
             break
         if char != "\n":
+            if tail_match.group(1):  # type: ignore[union-attr]
+                # The comment regex stopped at an illegal character
+                raise TOMLDecodeError(f"Found invalid character {char!r}", src, pos)
             raise TOMLDecodeError(
                 "Expected newline or end of document after a statement", src, pos
             )
@@ -217,13 +253,16 @@ def loads(__s: str, *, parse_float: ParseFloat = float) -> dict[str, Any]:  # no
 
 
 class Flags:
-    """Flags that map to parsed keys/namespaces."""
+    """Flags that map to parsed keys/namespaces.
+
+    Flags are stored as bits of an int, so each flag must be a power of two.
+    """
 
     # Marks an immutable namespace (inline array or inline table).
-    FROZEN: Final = 0
+    FROZEN: Final = 1
     # Marks a nest that has been explicitly created and can no longer
     # be opened using the "[table]" syntax.
-    EXPLICIT_NEST: Final = 1
+    EXPLICIT_NEST: Final = 2
 
     def __init__(self) -> None:
         self._flags: dict[str, dict] = {}
@@ -250,11 +289,11 @@ class Flags:
         key_parent, key_stem = key[:-1], key[-1]
         for k in key_parent:
             if k not in cont:
-                cont[k] = {"flags": set(), "recursive_flags": set(), "nested": {}}
+                cont[k] = {"flags": 0, "recursive_flags": 0, "nested": {}}
             cont = cont[k]["nested"]
         if key_stem not in cont:
-            cont[key_stem] = {"flags": set(), "recursive_flags": set(), "nested": {}}
-        cont[key_stem]["recursive_flags" if recursive else "flags"].add(flag)
+            cont[key_stem] = {"flags": 0, "recursive_flags": 0, "nested": {}}
+        cont[key_stem]["recursive_flags" if recursive else "flags"] |= flag
 
     def is_(self, key: Key, flag: int) -> bool:
         if not key:
@@ -264,13 +303,13 @@ class Flags:
             if k not in cont:
                 return False
             inner_cont = cont[k]
-            if flag in inner_cont["recursive_flags"]:
+            if inner_cont["recursive_flags"] & flag:
                 return True
             cont = inner_cont["nested"]
         key_stem = key[-1]
         if key_stem in cont:
             inner_cont = cont[key_stem]
-            return flag in inner_cont["flags"] or flag in inner_cont["recursive_flags"]
+            return bool((inner_cont["flags"] | inner_cont["recursive_flags"]) & flag)
         return False
 
 
@@ -283,29 +322,33 @@ class NestedDict:
         self,
         key: Key,
         *,
-        access_lists: bool = True,
+        root: dict | None = None,
     ) -> dict:
-        cont: Any = self.dict
+        cont: Any = self.dict if root is None else root
         for k in key:
             if k not in cont:
                 cont[k] = {}
             cont = cont[k]
-            if access_lists and isinstance(cont, list):
-                cont = cont[-1]
+            # Nests are nearly always dicts, so check for that first
             if not isinstance(cont, dict):
-                raise KeyError("There is no nest behind this key")
+                if isinstance(cont, list):
+                    cont = cont[-1]
+                if not isinstance(cont, dict):
+                    raise KeyError("There is no nest behind this key")
         return cont
 
-    def append_nest_to_list(self, key: Key) -> None:
+    def append_nest_to_list(self, key: Key) -> dict:
         cont = self.get_or_create_nest(key[:-1])
         last_key = key[-1]
+        nest: dict = {}
         if last_key in cont:
             list_ = cont[last_key]
             if not isinstance(list_, list):
                 raise KeyError("An object other than list found behind this key")
-            list_.append({})
+            list_.append(nest)
         else:
-            cont[last_key] = [{}]
+            cont[last_key] = [nest]
+        return nest
 
 
 class Output:
@@ -323,59 +366,64 @@ def skip_chars(src: str, pos: Pos, chars: Iterable[str]) -> Pos:
     return pos
 
 
+def skip_ws(src: str, pos: Pos) -> Pos:
+    # Same as `skip_chars(src, pos, TOML_WS)`. Substring search
+    # is faster than a set lookup for a charset this small.
+    try:
+        while src[pos] in " \t":
+            pos += 1
+    except IndexError:
+        pass
+    return pos
+
+
 def skip_until(
     src: str,
     pos: Pos,
     expect: str,
     *,
-    error_on: frozenset[str],
-    error_on_eof: bool,
+    error_on: re.Pattern,
 ) -> Pos:
     try:
         new_pos = src.index(expect, pos)
     except ValueError:
-        new_pos = len(src)
-        if error_on_eof:
-            raise TOMLDecodeError(f"Expected {expect!r}", src, new_pos) from None
+        raise TOMLDecodeError(f"Expected {expect!r}", src, len(src)) from None
 
-    if not error_on.isdisjoint(src[pos:new_pos]):
-        while src[pos] not in error_on:
-            pos += 1
+    illegal_match = error_on.search(src, pos, new_pos)
+    if illegal_match:
+        pos = illegal_match.start()
         raise TOMLDecodeError(f"Found invalid character {src[pos]!r}", src, pos)
     return new_pos
 
 
-def skip_comment(src: str, pos: Pos) -> Pos:
-    try:
-        char: str | None = src[pos]
-    except IndexError:
-        char = None
-    if char == "#":
-        return skip_until(
-            src, pos + 1, "\n", error_on=ILLEGAL_COMMENT_CHARS, error_on_eof=False
-        )
-    return pos
-
-
 def skip_comments_and_array_ws(src: str, pos: Pos) -> Pos:
-    while True:
-        pos_before_skip = pos
-        pos = skip_chars(src, pos, TOML_WS_AND_NEWLINE)
-        pos = skip_comment(src, pos)
-        if pos == pos_before_skip:
-            return pos
+    # Values are usually separated by nothing but a space or two,
+    # which is quicker to skip without calling into the regex engine
+    pos = skip_ws(src, pos)
+    if src[pos : pos + 1] not in ("\n", "#"):
+        return pos
+    # The regex always matches, possibly an empty string
+    ws_match: re.Match = RE_ARRAY_WS_AND_COMMENTS.match(  # type: ignore[assignment]
+        src, pos
+    )
+    pos = ws_match.end()
+    # A comment can only be ended by a newline, which the regex consumes,
+    # or by the end of the document. Anything else is an illegal character.
+    if ws_match.end(1) == pos and pos < len(src):
+        raise TOMLDecodeError(f"Found invalid character {src[pos]!r}", src, pos)
+    return pos
 
 
-def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
+def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key, dict]:
     pos += 1  # Skip "["
-    pos = skip_chars(src, pos, TOML_WS)
+    pos = skip_ws(src, pos)
     pos, key = parse_key(src, pos)
 
     if out.flags.is_(key, Flags.EXPLICIT_NEST) or out.flags.is_(key, Flags.FROZEN):
         raise TOMLDecodeError(f"Cannot declare {key} twice", src, pos)
     out.flags.set(key, Flags.EXPLICIT_NEST, recursive=False)
     try:
-        out.data.get_or_create_nest(key)
+        nest = out.data.get_or_create_nest(key)
     except KeyError:
         raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
 
@@ -383,12 +431,12 @@ def create_dict_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
         raise TOMLDecodeError(
             "Expected ']' at the end of a table declaration", src, pos
         )
-    return pos + 1, key
+    return pos + 1, key, nest
 
 
-def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
+def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key, dict]:
     pos += 2  # Skip "[["
-    pos = skip_chars(src, pos, TOML_WS)
+    pos = skip_ws(src, pos)
     pos, key = parse_key(src, pos)
 
     if out.flags.is_(key, Flags.FROZEN):
@@ -398,7 +446,7 @@ def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
     # ...but this key precisely is still prohibited from table declaration
     out.flags.set(key, Flags.EXPLICIT_NEST, recursive=False)
     try:
-        out.data.append_nest_to_list(key)
+        nest = out.data.append_nest_to_list(key)
     except KeyError:
         raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
 
@@ -406,11 +454,16 @@ def create_list_rule(src: str, pos: Pos, out: Output) -> tuple[Pos, Key]:
         raise TOMLDecodeError(
             "Expected ']]' at the end of an array declaration", src, pos
         )
-    return pos + 2, key
+    return pos + 2, key, nest
 
 
 def key_value_rule(
-    src: str, pos: Pos, out: Output, header: Key, parse_float: ParseFloat
+    src: str,
+    pos: Pos,
+    out: Output,
+    header: Key,
+    header_nest: dict,
+    parse_float: ParseFloat,
 ) -> Pos:
     pos, key, value = parse_key_value_pair(src, pos, parse_float, nest_lvl=0)
     key_parent, key_stem = key[:-1], key[-1]
@@ -430,8 +483,9 @@ def key_value_rule(
             f"Cannot mutate immutable namespace {abs_key_parent}", src, pos
         )
 
+    # The header nest is already resolved, so only walk the dotted key parent
     try:
-        nest = out.data.get_or_create_nest(abs_key_parent)
+        nest = out.data.get_or_create_nest(key_parent, root=header_nest)
     except KeyError:
         raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
     if key_stem in nest:
@@ -454,27 +508,35 @@ def parse_key_value_pair(
     if char != "=":
         raise TOMLDecodeError("Expected '=' after a key in a key/value pair", src, pos)
     pos += 1
-    pos = skip_chars(src, pos, TOML_WS)
+    pos = skip_ws(src, pos)
     pos, value = parse_value(src, pos, parse_float, nest_lvl)
     return pos, key, value
 
 
 def parse_key(src: str, pos: Pos) -> tuple[Pos, Key]:
-    pos, key_part = parse_key_part(src, pos)
-    key: Key = (key_part,)
-    pos = skip_chars(src, pos, TOML_WS)
-    while True:
-        try:
-            char: str | None = src[pos]
-        except IndexError:
-            char = None
-        if char != ".":
-            return pos, key
+    # Fast path: match all leading bare key parts, and the dots between
+    # them, at once. Quoted key parts are left for the loop below.
+    bare_key_match = RE_DOTTED_BARE_KEY.match(src, pos)
+    if bare_key_match:
+        pos = bare_key_match.end()
+        key_str = bare_key_match.group(1)
+        if "." not in key_str:
+            key: Key = (key_str,)
+        elif " " in key_str or "\t" in key_str:
+            key = tuple(RE_KEY_SEPARATOR.split(key_str))
+        else:
+            key = tuple(key_str.split("."))
+    else:
+        pos, key_part = parse_key_part(src, pos)
+        key = (key_part,)
+        pos = skip_ws(src, pos)
+    while src.startswith(".", pos):
         pos += 1
-        pos = skip_chars(src, pos, TOML_WS)
+        pos = skip_ws(src, pos)
         pos, key_part = parse_key_part(src, pos)
         key += (key_part,)
-        pos = skip_chars(src, pos, TOML_WS)
+        pos = skip_ws(src, pos)
+    return pos, key
 
 
 def parse_key_part(src: str, pos: Pos) -> tuple[Pos, str]:
@@ -484,7 +546,11 @@ def parse_key_part(src: str, pos: Pos) -> tuple[Pos, str]:
         char = None
     if char in BARE_KEY_CHARS:
         start_pos = pos
-        pos = skip_chars(src, pos, BARE_KEY_CHARS)
+        try:
+            while src[pos] in BARE_KEY_CHARS:
+                pos += 1
+        except IndexError:
+            pass
         return pos, src[start_pos:pos]
     if char == "'":
         return parse_literal_str(src, pos)
@@ -495,7 +561,24 @@ def parse_key_part(src: str, pos: Pos) -> tuple[Pos, str]:
 
 def parse_one_line_basic_str(src: str, pos: Pos) -> tuple[Pos, str]:
     pos += 1
-    return parse_basic_str(src, pos, multiline=False)
+    result = ""
+    start_pos = pos
+    while True:
+        # The regex always matches, possibly an empty string
+        pos = RE_BASIC_STR_PLAIN_CHARS.match(src, pos).end()  # type: ignore[union-attr]
+        try:
+            char = src[pos]
+        except IndexError:
+            raise TOMLDecodeError("Unterminated string", src, pos) from None
+        if char == '"':
+            return pos + 1, result + unescape_simple(src[start_pos:pos])
+        if char == "\\":
+            result += unescape_simple(src[start_pos:pos])
+            pos, parsed_escape = parse_basic_str_escape(src, pos)
+            result += parsed_escape
+            start_pos = pos
+            continue
+        raise TOMLDecodeError(f"Illegal character {char!r}", src, pos)
 
 
 def parse_array(
@@ -510,6 +593,13 @@ def parse_array(
     while True:
         pos, val = parse_value(src, pos, parse_float, nest_lvl)
         array.append(val)
+        if type(val) is int:
+            # Fast path for the following elements of an integer array
+            int_match = RE_ARRAY_NEXT_INT.match(src, pos)
+            while int_match:
+                array.append(int(int_match.group(1) or int_match.group(2)))
+                pos = int_match.end()
+                int_match = RE_ARRAY_NEXT_INT.match(src, pos)
         pos = skip_comments_and_array_ws(src, pos)
 
         c = src[pos : pos + 1]
@@ -528,34 +618,36 @@ def parse_inline_table(
     src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
 ) -> tuple[Pos, dict]:
     pos += 1
-    nested_dict = NestedDict()
-    flags = Flags()
+    table: dict = {}
+    # Keys of inline arrays and tables. Those and everything in them are immutable.
+    frozen: set[Key] = set()
 
-    pos = skip_chars(src, pos, TOML_WS)
+    pos = skip_ws(src, pos)
     if src.startswith("}", pos):
-        return pos + 1, nested_dict.dict
+        return pos + 1, table
     while True:
         pos, key, value = parse_key_value_pair(src, pos, parse_float, nest_lvl)
         key_parent, key_stem = key[:-1], key[-1]
-        if flags.is_(key, Flags.FROZEN):
+        if frozen and any(key[:i] in frozen for i in range(1, len(key) + 1)):
             raise TOMLDecodeError(f"Cannot mutate immutable namespace {key}", src, pos)
-        try:
-            nest = nested_dict.get_or_create_nest(key_parent, access_lists=False)
-        except KeyError:
-            raise TOMLDecodeError("Cannot overwrite a value", src, pos) from None
+        nest: Any = table
+        for k in key_parent:
+            nest = nest.setdefault(k, {})
+            if not isinstance(nest, dict):
+                raise TOMLDecodeError("Cannot overwrite a value", src, pos)
         if key_stem in nest:
             raise TOMLDecodeError(f"Duplicate inline table key {key_stem!r}", src, pos)
         nest[key_stem] = value
-        pos = skip_chars(src, pos, TOML_WS)
+        pos = skip_ws(src, pos)
         c = src[pos : pos + 1]
         if c == "}":
-            return pos + 1, nested_dict.dict
+            return pos + 1, table
         if c != ",":
             raise TOMLDecodeError("Unclosed inline table", src, pos)
         if isinstance(value, (dict, list)):
-            flags.set(key, Flags.FROZEN, recursive=True)
+            frozen.add(key)
         pos += 1
-        pos = skip_chars(src, pos, TOML_WS)
+        pos = skip_ws(src, pos)
 
 
 def parse_basic_str_escape(
@@ -567,7 +659,7 @@ def parse_basic_str_escape(
         # Skip whitespace until next non-whitespace character or end of
         # the doc. Error if non-whitespace is found before newline.
         if escape_id != "\\\n":
-            pos = skip_chars(src, pos, TOML_WS)
+            pos = skip_ws(src, pos)
             try:
                 char = src[pos]
             except IndexError:
@@ -581,10 +673,20 @@ def parse_basic_str_escape(
         return parse_hex_char(src, pos, 4)
     if escape_id == "\\U":
         return parse_hex_char(src, pos, 8)
-    try:
-        return pos, BASIC_STR_ESCAPE_REPLACEMENTS[escape_id]
-    except KeyError:
-        raise TOMLDecodeError("Unescaped '\\' in a string", src, pos) from None
+    # Single character escapes have already been matched by
+    # `RE_BASIC_STR_PLAIN_CHARS`, so anything else is invalid.
+    raise TOMLDecodeError("Unescaped '\\' in a string", src, pos)
+
+
+def replace_simple_escape(match: re.Match) -> str:
+    return BASIC_STR_ESCAPE_REPLACEMENTS[match.group()]
+
+
+def unescape_simple(s: str) -> str:
+    """Replace single character escapes in a run of basic string chars."""
+    if "\\" not in s:
+        return s
+    return RE_SIMPLE_ESCAPE.sub(replace_simple_escape, s)
 
 
 def parse_basic_str_escape_multiline(src: str, pos: Pos) -> tuple[Pos, str]:
@@ -607,9 +709,7 @@ def parse_hex_char(src: str, pos: Pos, hex_len: int) -> tuple[Pos, str]:
 def parse_literal_str(src: str, pos: Pos) -> tuple[Pos, str]:
     pos += 1  # Skip starting apostrophe
     start_pos = pos
-    pos = skip_until(
-        src, pos, "'", error_on=ILLEGAL_LITERAL_STR_CHARS, error_on_eof=True
-    )
+    pos = skip_until(src, pos, "'", error_on=RE_ILLEGAL_LITERAL_STR_CHAR)
     return pos + 1, src[start_pos:pos]  # Skip ending apostrophe
 
 
@@ -624,14 +724,13 @@ def parse_multiline_str(src: str, pos: Pos, *, literal: bool) -> tuple[Pos, str]
             src,
             pos,
             "'''",
-            error_on=ILLEGAL_MULTILINE_LITERAL_STR_CHARS,
-            error_on_eof=True,
+            error_on=RE_ILLEGAL_MULTILINE_LITERAL_STR_CHAR,
         )
         result = src[pos:end_pos]
         pos = end_pos + 3
     else:
         delim = '"'
-        pos, result = parse_basic_str(src, pos, multiline=True)
+        pos, result = parse_multiline_basic_str(src, pos)
 
     # Add at maximum two extra apostrophes/quotes if the end sequence
     # is 4 or 5 chars long instead of just 3.
@@ -644,39 +743,32 @@ def parse_multiline_str(src: str, pos: Pos, *, literal: bool) -> tuple[Pos, str]
     return pos, result + (delim * 2)
 
 
-def parse_basic_str(src: str, pos: Pos, *, multiline: bool) -> tuple[Pos, str]:
-    if multiline:
-        error_on = ILLEGAL_MULTILINE_BASIC_STR_CHARS
-        parse_escapes = parse_basic_str_escape_multiline
-    else:
-        error_on = ILLEGAL_BASIC_STR_CHARS
-        parse_escapes = parse_basic_str_escape
+def parse_multiline_basic_str(src: str, pos: Pos) -> tuple[Pos, str]:
     result = ""
     start_pos = pos
     while True:
+        # The regex always matches, possibly an empty string
+        plain_chars = RE_MULTILINE_BASIC_STR_PLAIN_CHARS.match(src, pos)
+        pos = plain_chars.end()  # type: ignore[union-attr]
         try:
             char = src[pos]
         except IndexError:
             raise TOMLDecodeError("Unterminated string", src, pos) from None
         if char == '"':
-            if not multiline:
-                return pos + 1, result + src[start_pos:pos]
             if src.startswith('"""', pos):
-                return pos + 3, result + src[start_pos:pos]
+                return pos + 3, result + unescape_simple(src[start_pos:pos])
             pos += 1
             continue
         if char == "\\":
-            result += src[start_pos:pos]
-            pos, parsed_escape = parse_escapes(src, pos)
+            result += unescape_simple(src[start_pos:pos])
+            pos, parsed_escape = parse_basic_str_escape_multiline(src, pos)
             result += parsed_escape
             start_pos = pos
             continue
-        if char in error_on:
-            raise TOMLDecodeError(f"Illegal character {char!r}", src, pos)
-        pos += 1
+        raise TOMLDecodeError(f"Illegal character {char!r}", src, pos)
 
 
-def parse_value(  # noqa: C901
+def parse_value(
     src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
 ) -> tuple[Pos, Any]:
     if nest_lvl > MAX_INLINE_NESTING:
@@ -687,71 +779,112 @@ def parse_value(  # noqa: C901
             f" {MAX_INLINE_NESTING} levels"
         )
 
-    try:
-        char: str | None = src[pos]
-    except IndexError:
-        char = None
+    value_parser = VALUE_PARSERS.get(src[pos : pos + 1])
+    if value_parser is None:
+        raise TOMLDecodeError("Invalid value", src, pos)
+    return value_parser(src, pos, parse_float, nest_lvl + 1)
 
-    # IMPORTANT: order conditions based on speed of checking and likelihood
 
-    # Basic strings
-    if char == '"':
-        if src.startswith('"""', pos):
-            return parse_multiline_str(src, pos, literal=False)
-        return parse_one_line_basic_str(src, pos)
+# The functions below parse a value based on its first character. They
+# all share the signature of `parse_value`, and are dispatched to from
+# there using the `VALUE_PARSERS` mapping. `nest_lvl` is the nesting
+# level of the parsed value, and only matters for arrays and inline tables.
 
-    # Literal strings
-    if char == "'":
-        if src.startswith("'''", pos):
-            return parse_multiline_str(src, pos, literal=True)
-        return parse_literal_str(src, pos)
 
-    # Booleans
-    if char == "t":
-        if src.startswith("true", pos):
-            return pos + 4, True
-    if char == "f":
-        if src.startswith("false", pos):
-            return pos + 5, False
-
-    # Arrays
-    if char == "[":
-        return parse_array(src, pos, parse_float, nest_lvl + 1)
-
-    # Inline tables
-    if char == "{":
-        return parse_inline_table(src, pos, parse_float, nest_lvl + 1)
-
-    # Dates and times
-    datetime_match = RE_DATETIME.match(src, pos)
-    if datetime_match:
-        try:
-            datetime_obj = match_to_datetime(datetime_match)
-        except ValueError as e:
-            raise TOMLDecodeError("Invalid date or datetime", src, pos) from e
-        return datetime_match.end(), datetime_obj
-    localtime_match = RE_LOCALTIME.match(src, pos)
-    if localtime_match:
-        return localtime_match.end(), match_to_localtime(localtime_match)
+def parse_basic_str_value(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    if src.startswith('"""', pos):
+        return parse_multiline_str(src, pos, literal=False)
+    return parse_one_line_basic_str(src, pos)
+
+
+def parse_literal_str_value(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    if src.startswith("'''", pos):
+        return parse_multiline_str(src, pos, literal=True)
+    return parse_literal_str(src, pos)
+
+
+def parse_true(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    if src.startswith("true", pos):
+        return pos + 4, True
+    raise TOMLDecodeError("Invalid value", src, pos)
+
+
+def parse_false(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    if src.startswith("false", pos):
+        return pos + 5, False
+    raise TOMLDecodeError("Invalid value", src, pos)
+
+
+def parse_number_or_datetime(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    # Dates and times. Peek at the "-" of "YYYY-" or the ":" of "HH:"
+    # first so that plain numbers skip the doomed regex matches.
+    if src.startswith("-", pos + 4):
+        datetime_match = RE_DATETIME.match(src, pos)
+        if datetime_match:
+            try:
+                datetime_obj = match_to_datetime(datetime_match)
+            except ValueError as e:
+                raise TOMLDecodeError("Invalid date or datetime", src, pos) from e
+            return datetime_match.end(), datetime_obj
+    elif src.startswith(":", pos + 2):
+        localtime_match = RE_LOCALTIME.match(src, pos)
+        if localtime_match:
+            return localtime_match.end(), match_to_localtime(localtime_match)
 
     # Integers and "normal" floats.
     # The regex will greedily match any type starting with a decimal
     # char, so needs to be located after handling of dates and times.
+    # It always matches at least the first digit.
+    number_match: re.Match = RE_NUMBER.match(src, pos)  # type: ignore[assignment]
+    return number_match.end(), match_to_number(number_match, parse_float)
+
+
+def parse_signed_number(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
     number_match = RE_NUMBER.match(src, pos)
     if number_match:
         return number_match.end(), match_to_number(number_match, parse_float)
-
-    # Special floats
-    first_three = src[pos : pos + 3]
-    if first_three in {"inf", "nan"}:
-        return pos + 3, parse_float(first_three)
     first_four = src[pos : pos + 4]
     if first_four in {"-inf", "+inf", "-nan", "+nan"}:
         return pos + 4, parse_float(first_four)
+    raise TOMLDecodeError("Invalid value", src, pos)
+
 
+def parse_special_float(
+    src: str, pos: Pos, parse_float: ParseFloat, nest_lvl: int
+) -> tuple[Pos, Any]:
+    first_three = src[pos : pos + 3]
+    if first_three in {"inf", "nan"}:
+        return pos + 3, parse_float(first_three)
     raise TOMLDecodeError("Invalid value", src, pos)
 
 
+VALUE_PARSERS: Final = {
+    '"': parse_basic_str_value,
+    "'": parse_literal_str_value,
+    "t": parse_true,
+    "f": parse_false,
+    "[": parse_array,
+    "{": parse_inline_table,
+    **{digit: parse_number_or_datetime for digit in "0123456789"},
+    "+": parse_signed_number,
+    "-": parse_signed_number,
+    "i": parse_special_float,
+    "n": parse_special_float,
+}
+
+
 def is_unicode_scalar_value(codepoint: int) -> bool:
     return (0 <= codepoint <= 55295) or (57344 <= codepoint <= 1114111)
 